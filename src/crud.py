@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import re
@@ -802,6 +803,14 @@ async def check_episode_exists(session: AsyncSession, episode_id: int) -> bool:
     result = await session.execute(stmt)
     return result.scalar_one_or_none() is not None
 
+def _read_comments_from_file(absolute_path: Path) -> List[Dict[str, Any]]:
+    """同步读取并解析弹幕XML文件，供 fetch_comments 在线程中调用。"""
+    if not absolute_path.exists():
+        logger.warning(f"数据库记录了弹幕文件路径，但文件不存在: {absolute_path}")
+        return []
+    xml_content = absolute_path.read_text(encoding='utf-8')
+    return parse_dandan_xml_to_comments(xml_content)
+
 async def fetch_comments(session: AsyncSession, episode_id: int) -> List[Dict[str, Any]]:
     """从XML文件获取弹幕。"""
     episode = await session.get(Episode, episode_id)
@@ -813,12 +822,8 @@ async def fetch_comments(session: AsyncSession, episode_id: int) -> List[Dict[st
         if not absolute_path:
             return [] # 辅助函数会记录警告
         
-        if not absolute_path.exists():
-            logger.warning(f"数据库记录了弹幕文件路径，但文件不存在: {absolute_path}")
-            return []
-            
-        xml_content = absolute_path.read_text(encoding='utf-8')
-        return parse_dandan_xml_to_comments(xml_content)
+        # 文件检查、读取和解析都是阻塞操作，放到线程中执行以免阻塞事件循环
+        return await asyncio.to_thread(_read_comments_from_file, absolute_path)
     except Exception as e:
         logger.error(f"读取或解析弹幕文件失败: {episode.danmakuFilePath}。错误: {e}", exc_info=True)
         return []
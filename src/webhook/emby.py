@@ -1,5 +1,6 @@
 import logging
 from typing import Any, Dict
+import orjson
 from fastapi import Request, HTTPException, status
 
 from .base import BaseWebhook
@@ -8,20 +9,24 @@ from .tasks import webhook_search_and_dispatch_task
 
 logger = logging.getLogger(__name__)
 
+# 处理的事件类型和媒体类型，模块级 frozenset 避免每次请求重建列表
+_HANDLED_EVENTS = frozenset({"library.new"})
+_HANDLED_ITEM_TYPES = frozenset({"Episode", "Movie"})
+
 class EmbyWebhook(BaseWebhook):
     async def handle(self, request: Request):
         # 处理器现在负责解析请求体。
         # Emby 通常发送 application/json。
         try:
-            payload = await request.json()
-        except Exception:
+            payload = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
             self.logger.error("Emby Webhook: 无法解析请求体为JSON。")
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="请求体不是有效的JSON。")
 
         event_type = payload.get("Event")
         # 我们只关心新媒体入库的事件, 兼容 emby 的 'library.new' 和 jellyfin 的 'item.add'
-        if event_type not in ["library.new"]:
-            logger.info(f"Webhook: 忽略非 'item.add' 或 'library.new' 的事件 (类型: {event_type})")
+        if event_type not in _HANDLED_EVENTS:
+            logger.info("Webhook: 忽略非 'item.add' 或 'library.new' 的事件 (类型: %s)", event_type)
             return
 
         item = payload.get("Item", {})
@@ -30,8 +35,8 @@ class EmbyWebhook(BaseWebhook):
             return
 
         item_type = item.get("Type")
-        if item_type not in ["Episode", "Movie"]:
-            logger.info(f"Webhook: 忽略非 'Episode' 或 'Movie' 的媒体项 (类型: {item_type})")
+        if item_type not in _HANDLED_ITEM_TYPES:
+            logger.info("Webhook: 忽略非 'Episode' 或 'Movie' 的媒体项 (类型: %s)", item_type)
             return
 
         # 提取通用信息
@@ -51,25 +56,27 @@ class EmbyWebhook(BaseWebhook):
             episode_number = item.get("IndexNumber")
             
             if not all([series_title, season_number is not None, episode_number is not None]):
-                logger.warning(f"Webhook: 忽略一个剧集，因为缺少系列标题、季度或集数信息。")
+                logger.warning("Webhook: 忽略一个剧集，因为缺少系列标题、季度或集数信息。")
                 return
 
-            logger.info(f"Emby Webhook: 解析到剧集 - 标题: '{series_title}', 类型: Episode, 季: {season_number}, 集: {episode_number}")
-            logger.info(f"Webhook: 收到剧集 '{series_title}' S{season_number:02d}E{episode_number:02d}' 的入库通知。")
+            logger.info("Emby Webhook: 解析到剧集 - 标题: '%s', 类型: Episode, 季: %s, 集: %s", series_title, season_number, episode_number)
+            # 季集标记只格式化一次，供日志、任务标题和搜索关键词复用
+            episode_tag = f"S{season_number:02d}E{episode_number:02d}"
+            logger.info("Webhook: 收到剧集 '%s' %s' 的入库通知。", series_title, episode_tag)
             
-            task_title = f"Webhook（emby）搜索: {series_title} - S{season_number:02d}E{episode_number:02d}"
-            search_keyword = f"{series_title} S{season_number:02d}E{episode_number:02d}"
+            task_title = f"Webhook（emby）搜索: {series_title} - {episode_tag}"
+            search_keyword = f"{series_title} {episode_tag}"
             media_type = "tv_series"
             anime_title = series_title
             
         elif item_type == "Movie":
             movie_title = item.get("Name")
             if not movie_title:
-                logger.warning(f"Webhook: 忽略一个电影，因为缺少标题信息。")
+                logger.warning("Webhook: 忽略一个电影，因为缺少标题信息。")
                 return
             
-            logger.info(f"Emby Webhook: 解析到电影 - 标题: '{movie_title}', 类型: Movie")
-            logger.info(f"Webhook: 收到电影 '{movie_title}' 的入库通知。")
+            logger.info("Emby Webhook: 解析到电影 - 标题: '%s', 类型: Movie", movie_title)
+            logger.info("Webhook: 收到电影 '%s' 的入库通知。", movie_title)
             
             task_title = f"Webhook（emby）搜索: {movie_title}"
             search_keyword = movie_title
@@ -80,7 +87,10 @@ class EmbyWebhook(BaseWebhook):
         
         # 新逻辑：总是触发全网搜索任务，并附带元数据ID
         unique_key = f"webhook-search-{anime_title}-S{season_number}-E{episode_number}"
-        logger.info(f"Webhook: 准备为 '{anime_title}' 创建全网搜索任务，并附加元数据ID (TMDB: {tmdb_id}, IMDb: {imdb_id}, TVDB: {tvdb_id}, Douban: {douban_id})。")
+        logger.info(
+            "Webhook: 准备为 '%s' 创建全网搜索任务，并附加元数据ID (TMDB: %s, IMDb: %s, TVDB: %s, Douban: %s)。",
+            anime_title, tmdb_id, imdb_id, tvdb_id, douban_id
+        )
 
         # 使用新的、专门的 webhook 任务
         task_coro = lambda session, callback: webhook_search_and_dispatch_task(